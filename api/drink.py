@@ -0,0 +1,3 @@
+from cinos_ice_storm import Drink
+
+__all__ = ['Drink']
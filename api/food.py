@@ -0,0 +1,3 @@
+from cinos_ice_storm import Food
+
+__all__ = ['Food']
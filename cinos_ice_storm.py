@@ -0,0 +1,572 @@
+# Performance note: the hot paths here (get_price, get_total,
+# generate_receipt, get_receipt) do trivial arithmetic and string work, so
+# their measured cost is dominated by CPython bytecode dispatch, attribute
+# lookups, and dict/list overhead — not ALU or memory bandwidth. Optimize by
+# cutting interpreter work (precomputed tables, bitmasks, __slots__, cached
+# renders), not by vectorizing. In particular, do not wrap these
+# Python-object-heavy methods in numba's @njit: they would fall back to
+# object mode and get slower. Batch workloads that want native speed should
+# go through the array snapshots and the JIT-compiled kernel in batch_totals.
+from __future__ import annotations
+
+import sys
+from types import MappingProxyType
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from typing import List, Dict, Mapping, Optional, Tuple, Union
+
+class Drink:
+    """Class to represent a drink with a single base and multiple flavors."""
+
+    __slots__ = ('_base', '_flavors_mask', '_sorted_flavors_cache', '_sorted_flavors_dirty', '_parents')
+
+    # Interned names turn the hot membership checks into pointer compares.
+    _VALID_BASES = [sys.intern(b) for b in ('water', 'sbrite', 'pokeacola', 'Mr. Salt', 'hill fog', 'leaf wine')]
+    _VALID_FLAVORS = [sys.intern(f) for f in ('lemon', 'cherry', 'strawberry', 'mint', 'blueberry', 'lime')]
+    # Frozensets give O(1) membership checks; the lists above keep the display order.
+    _VALID_BASES_SET = frozenset(_VALID_BASES)
+    _VALID_FLAVORS_SET = frozenset(_VALID_FLAVORS)
+    # Immutable views handed out by the getters, built once.
+    _VALID_BASES_VIEW = tuple(_VALID_BASES)
+    _VALID_FLAVORS_VIEW = tuple(_VALID_FLAVORS)
+    # Flavors are stored as a bitmask; bits follow sorted name order so a
+    # low-to-high walk yields the display order, as with the topping masks.
+    _FLAVOR_NAMES_SORTED = tuple(sorted(_VALID_FLAVORS))
+    _FLAVOR_INDEX = {name: i for i, name in enumerate(_FLAVOR_NAMES_SORTED)}
+
+    def __init__(self) -> None:
+        """Initialize a drink with no base and no flavors."""
+        self._base: Optional[str] = None
+        self._flavors_mask: int = 0
+        self._sorted_flavors_cache: List[str] = []
+        self._sorted_flavors_dirty: bool = False
+        # One entry per containing order occurrence, appended by Order.add_item.
+        self._parents: Optional[List[Order]] = None
+
+    @classmethod
+    def get_valid_bases(cls) -> Tuple[str, ...]:
+        return cls._VALID_BASES_VIEW
+
+    @classmethod
+    def get_valid_flavors(cls) -> Tuple[str, ...]:
+        return cls._VALID_FLAVORS_VIEW
+
+    def get_base(self) -> Optional[str]:
+        return self._base
+
+    def get_flavors(self) -> List[str]:
+        if self._sorted_flavors_dirty:
+            mask = self._flavors_mask
+            flavors = []
+            while mask:
+                bit = mask & -mask
+                flavors.append(self._FLAVOR_NAMES_SORTED[bit.bit_length() - 1])
+                mask ^= bit
+            self._sorted_flavors_cache = flavors
+            self._sorted_flavors_dirty = False
+        # Copy so callers can't mutate the cache, matching the baseline's fresh list.
+        return list(self._sorted_flavors_cache)
+
+    def get_num_flavors(self) -> int:
+        return self._flavors_mask.bit_count()
+
+    def _notify_parents(self) -> None:
+        if self._parents:
+            for parent in self._parents:
+                parent._bump_epoch()
+
+    def _raise_invalid_base(self, base: str) -> None:
+        # Kept out of add_base so the success path carries no message-building code.
+        raise ValueError(f"Invalid base: {base}. Valid options: {self._VALID_BASES}")
+
+    def _raise_invalid_flavor(self, flavor: str) -> None:
+        raise ValueError(f"Invalid flavor: {flavor}. Valid options: {self._VALID_FLAVORS}")
+
+    def _raise_invalid_flavors(self, invalid_flavors: set) -> None:
+        raise ValueError(f"Invalid flavors: {invalid_flavors}. Valid options: {self._VALID_FLAVORS}")
+
+    def add_base(self, base: str) -> None:
+        if self._base is not None:
+            raise ValueError("A base has already been added.")
+        base = sys.intern(base)
+        if base not in self._VALID_BASES_SET:
+            self._raise_invalid_base(base)
+        self._base = base
+        self._notify_parents()
+
+    def add_flavor(self, flavor: str) -> None:
+        flavor = sys.intern(flavor)
+        if flavor not in self._VALID_FLAVORS_SET:
+            self._raise_invalid_flavor(flavor)
+        bit = 1 << self._FLAVOR_INDEX[flavor]
+        if self._flavors_mask & bit:
+            raise ValueError(f"Flavor '{flavor}' has already been added.")
+        self._flavors_mask |= bit
+        self._sorted_flavors_dirty = True
+        self._notify_parents()
+
+    def set_flavors(self, flavors: List[str]) -> None:
+        valid = self._VALID_FLAVORS_SET
+        flavor_index = self._FLAVOR_INDEX
+        mask = 0
+        invalid_flavors = None
+        for flavor in flavors:
+            flavor = sys.intern(flavor)
+            if flavor in valid:
+                mask |= 1 << flavor_index[flavor]
+            elif invalid_flavors is None:
+                invalid_flavors = {flavor}
+            else:
+                invalid_flavors.add(flavor)
+        if invalid_flavors:
+            self._raise_invalid_flavors(invalid_flavors)
+        self._flavors_mask = mask
+        self._sorted_flavors_dirty = True
+        self._notify_parents()
+
+    def line_price(self) -> float:
+        """Return the price this drink contributes to an order."""
+        return 5.00  # Fixed price per drink
+
+    def receipt_line(self, idx: int) -> str:
+        """Return this drink's line on an order receipt."""
+        return f"{idx}. Drink - Base: {self.get_base() or 'None'}, Flavors: {', '.join(self.get_flavors()) or 'None'}"
+
+    def _batch_row(self) -> tuple:
+        """Return (kind, toppings mask, base price) for batch total kernels."""
+        return 0, 0, 5.00
+
+
+class Food:
+    """Class to represent a food item with optional toppings."""
+
+    __slots__ = ('_food_item', '_base_price', '_header_line', '_toppings_mask', '_toppings_total',
+                 '_sorted_toppings_cache', '_sorted_toppings_dirty', '_parents')
+
+    _VALID_FOOD_ITEMS: Dict[str, float] = {sys.intern(k): v for k, v in {
+        'Hotdog': 2.30,
+        'Corndog': 2.00,
+        'Ice Cream': 3.00,
+        'Onion Rings': 1.75,
+        'French Fries': 1.50,
+        'Tater Tots': 1.70,
+        'Nacho Chips': 1.90
+    }.items()}
+    _VALID_TOPPINGS: Dict[str, float] = {sys.intern(k): v for k, v in {
+        'Cherry': 0.00,
+        'Whipped Cream': 0.00,
+        'Caramel Sauce': 0.50,
+        'Chocolate Sauce': 0.50,
+        'Nacho Cheese': 0.30,
+        'Chili': 0.60,
+        'Bacon Bits': 0.30,
+        'Ketchup': 0.00,
+        'Mustard': 0.00
+    }.items()}
+    _VALID_FOOD_ITEMS_KEYS = frozenset(_VALID_FOOD_ITEMS)
+    _VALID_TOPPINGS_KEYS = frozenset(_VALID_TOPPINGS)
+    # Materialized once so the error paths don't rebuild a list per raise.
+    _VALID_FOOD_ITEM_NAMES = list(_VALID_FOOD_ITEMS)
+    _VALID_TOPPING_NAMES = list(_VALID_TOPPINGS)
+    # Each topping gets a bit position; instances store a mask instead of a dict.
+    # Bits are assigned in sorted name order so walking them low-to-high yields
+    # the receipt order without sorting.
+    _SORTED_TOPPING_ITEMS = sorted(_VALID_TOPPINGS.items())
+    _TOPPING_NAMES = tuple(name for name, _ in _SORTED_TOPPING_ITEMS)
+    _TOPPING_COSTS = tuple(cost for _, cost in _SORTED_TOPPING_ITEMS)
+    _TOPPING_INDEX = {name: i for i, name in enumerate(_TOPPING_NAMES)}
+    # Table prices never change, so their display strings are formatted once.
+    _TOPPING_COST_STRS = tuple(f"${cost:.2f}" for cost in _TOPPING_COSTS)
+    _BASE_PRICE_STRS = {name: f"${price:.2f}" for name, price in _VALID_FOOD_ITEMS.items()}
+    # Read-only views handed out by the getters, built once.
+    _VALID_FOOD_ITEMS_VIEW = MappingProxyType(_VALID_FOOD_ITEMS)
+    _VALID_TOPPINGS_VIEW = MappingProxyType(_VALID_TOPPINGS)
+
+    def _raise_invalid_food_item(self, food_item: str) -> None:
+        raise ValueError(f"Invalid food item: {food_item}. Valid options: {self._VALID_FOOD_ITEM_NAMES}")
+
+    def _raise_invalid_topping(self, topping: str) -> None:
+        raise ValueError(f"Invalid topping: {topping}. Valid options: {self._VALID_TOPPING_NAMES}")
+
+    def _raise_invalid_toppings(self, toppings: List[str]) -> None:
+        raise ValueError(f"Invalid toppings: {toppings}. Valid options: {self._VALID_TOPPING_NAMES}")
+
+    def __init__(self, food_item: str) -> None:
+        food_item = sys.intern(food_item)
+        if food_item not in self._VALID_FOOD_ITEMS_KEYS:
+            self._raise_invalid_food_item(food_item)
+        self._food_item: str = food_item
+        self._base_price: float = self._VALID_FOOD_ITEMS[food_item]
+        # Food item and base price are immutable, so the receipt header is too.
+        self._header_line: str = f"{food_item}\n- Base Price: {self._BASE_PRICE_STRS[food_item]}"
+        self._toppings_mask: int = 0
+        self._toppings_total: float = 0.0
+        self._sorted_toppings_cache: List[tuple] = []
+        self._sorted_toppings_dirty: bool = False
+        self._parents: Optional[List[Order]] = None
+
+    def _notify_parents(self) -> None:
+        if self._parents:
+            for parent in self._parents:
+                parent._bump_epoch()
+
+    @classmethod
+    def get_valid_food_items(cls) -> Mapping[str, float]:
+        return cls._VALID_FOOD_ITEMS_VIEW
+
+    @classmethod
+    def get_valid_toppings(cls) -> Mapping[str, float]:
+        return cls._VALID_TOPPINGS_VIEW
+
+    def get_food_type(self) -> str:
+        return self._food_item
+
+    def get_price(self) -> float:
+        return self._base_price + self._toppings_total
+
+    def add_topping(self, topping: str) -> None:
+        topping = sys.intern(topping)
+        if topping not in self._VALID_TOPPINGS_KEYS:
+            self._raise_invalid_topping(topping)
+        index = self._TOPPING_INDEX[topping]
+        bit = 1 << index
+        if self._toppings_mask & bit:
+            raise ValueError(f"Topping '{topping}' has already been added.")
+        self._toppings_mask |= bit
+        self._toppings_total += self._TOPPING_COSTS[index]
+        self._sorted_toppings_dirty = True
+        self._notify_parents()
+
+    def add_toppings(self, toppings: List[str]) -> None:
+        """Add several toppings at once, validating the whole batch up front."""
+        names = [sys.intern(t) for t in toppings]
+        unknown = [t for t in names if t not in self._VALID_TOPPINGS_KEYS]
+        if unknown:
+            self._raise_invalid_toppings(unknown)
+        # Work on locals and write back once so the loop stays LOAD_FAST-only
+        # and a duplicate leaves the instance untouched.
+        mask = self._toppings_mask
+        total = self._toppings_total
+        topping_index = self._TOPPING_INDEX
+        topping_costs = self._TOPPING_COSTS
+        for name in names:
+            index = topping_index[name]
+            bit = 1 << index
+            if mask & bit:
+                raise ValueError(f"Topping '{name}' has already been added.")
+            mask |= bit
+            total += topping_costs[index]
+        self._toppings_mask = mask
+        self._toppings_total = total
+        self._sorted_toppings_dirty = True
+        self._notify_parents()
+
+    def _sorted_toppings(self) -> List[tuple]:
+        if self._sorted_toppings_dirty:
+            mask = self._toppings_mask
+            items = []
+            while mask:
+                bit = mask & -mask
+                index = bit.bit_length() - 1
+                items.append((self._TOPPING_NAMES[index], self._TOPPING_COST_STRS[index]))
+                mask ^= bit
+            self._sorted_toppings_cache = items
+            self._sorted_toppings_dirty = False
+        return self._sorted_toppings_cache
+
+    def get_toppings(self) -> List[str]:
+        return [topping for topping, _ in self._sorted_toppings()]
+
+    def get_num_toppings(self) -> int:
+        return self._toppings_mask.bit_count()
+
+    def generate_receipt(self) -> str:
+        topping_lines = [f"- {topping}: {cost_str}" for topping, cost_str in self._sorted_toppings()]
+        return "\n".join([
+            self._header_line,
+            *topping_lines,
+            f"Total: ${self.get_price():.2f}",
+        ])
+
+    def line_price(self) -> float:
+        """Return the price this food item contributes to an order."""
+        return self.get_price()
+
+    def receipt_line(self, idx: int) -> str:
+        """Return this food item's lines on an order receipt."""
+        return f"{idx}. {self.generate_receipt()}"
+
+    def _batch_row(self) -> tuple:
+        """Return (kind, toppings mask, base price) for batch total kernels."""
+        return 1, self._toppings_mask, self._base_price
+
+
+class Order:
+    """Class to manage a collection of food and drink items."""
+
+    __slots__ = ('_items', '_epoch', '_receipt_cache')
+
+    _HEADER = "--- Order Receipt ---"
+    _EMPTY_MESSAGE = "Order is empty. Add some items!"
+
+    def __init__(self) -> None:
+        self._items: List[Union[Drink, Food, IceStorm]] = []
+        self._epoch: int = 0
+        self._receipt_cache: Optional[tuple] = None
+
+    def _bump_epoch(self) -> None:
+        """Invalidate cached renders after the order (or a contained item) changes."""
+        self._epoch += 1
+        self._receipt_cache = None
+
+    def get_items(self) -> List[Union[Drink, Food, IceStorm]]:
+        return self._items
+
+    def get_num_items(self) -> int:
+        return len(self._items)
+
+    def get_total(self) -> float:
+        return sum(item.line_price() for item in self._items)
+
+    def snapshot_arrays(self) -> tuple:
+        """Return (masks, base_prices, kinds) NumPy arrays for this order's items.
+
+        Kind codes are 0=drink, 1=food, 2=ice storm; see batch_totals for the
+        kernel that consumes these snapshots. Requires numpy.
+        """
+        import numpy as np
+
+        n = len(self._items)
+        masks = np.zeros(n, dtype=np.int64)
+        base_prices = np.zeros(n, dtype=np.float64)
+        kinds = np.zeros(n, dtype=np.uint8)
+        for i, item in enumerate(self._items):
+            kinds[i], masks[i], base_prices[i] = item._batch_row()
+        return masks, base_prices, kinds
+
+    def get_receipt(self) -> str:
+        if not self._items:
+            return self._EMPTY_MESSAGE
+
+        if self._receipt_cache is not None and self._receipt_cache[0] == self._epoch:
+            return self._receipt_cache[1]
+
+        item_lines = [item.receipt_line(idx) for idx, item in enumerate(self._items, 1)]
+        receipt = "\n".join([
+            self._HEADER,
+            *item_lines,
+            f"Total Items: {self.get_num_items()}",
+            f"Total Cost: ${self.get_total():.2f}",
+        ])
+        self._receipt_cache = (self._epoch, receipt)
+        return receipt
+
+    def add_item(self, item: Union[Drink, Food, IceStorm]) -> None:
+        if not isinstance(item, (Drink, Food, IceStorm)):
+            raise TypeError("Invalid item. Only Drink, Food, or IceStorm objects are allowed.")
+        # One parents entry per occurrence, so the same item can sit in several
+        # orders (or several times in one) and still invalidate all of them.
+        if item._parents is None:
+            item._parents = [self]
+        else:
+            item._parents.append(self)
+        self._items.append(item)
+        self._bump_epoch()
+
+    def remove_item(self, index: int) -> None:
+        if index < 0 or index >= len(self._items):
+            raise IndexError("Invalid index. No item removed.")
+        self._items.pop(index)._parents.remove(self)
+        self._bump_epoch()
+
+
+class IceStorm:
+    """Class to represent the Ice Storm menu item with flavors and mix-ins/toppings."""
+
+    __slots__ = ('_flavor', '_base_price', '_header_line', '_toppings_mask', '_toppings_total',
+                 '_cost_overrides', '_sorted_toppings_cache', '_sorted_toppings_dirty', '_parents')
+
+    _VALID_FLAVORS = {sys.intern(k): v for k, v in {
+        'Mint Chocolate Chip': 4.00,
+        'Chocolate': 3.00,
+        'Vanilla Bean': 3.00,
+        'Banana': 3.50,
+        'Butter Pecan': 3.50,
+        'S\'more': 4.00,
+    }.items()}
+    _VALID_TOPPINGS = {sys.intern(k): v for k, v in {
+        'Cherry': 0.00,
+        'Whipped Cream': 0.00,
+        'Caramel Sauce': 0.50,
+        'Chocolate Sauce': 0.50,
+        'Storios': 1.00,
+        'Dig Dogs': 1.00,
+        'T&T\'s': 1.00,
+        'Cookie Dough': 1.00,
+        'Pecans': 0.50
+    }.items()}
+    _VALID_FLAVORS_KEYS = frozenset(_VALID_FLAVORS)
+    _VALID_TOPPINGS_KEYS = frozenset(_VALID_TOPPINGS)
+    _VALID_FLAVOR_NAMES = list(_VALID_FLAVORS)
+    _VALID_TOPPING_NAMES = list(_VALID_TOPPINGS)
+    # Bit positions follow sorted name order; see the note on Food.
+    _SORTED_TOPPING_ITEMS = sorted(_VALID_TOPPINGS.items())
+    _TOPPING_NAMES = tuple(name for name, _ in _SORTED_TOPPING_ITEMS)
+    _TOPPING_COSTS = tuple(cost for _, cost in _SORTED_TOPPING_ITEMS)
+    _TOPPING_INDEX = {name: i for i, name in enumerate(_TOPPING_NAMES)}
+    _TOPPING_COST_STRS = tuple(f"${cost:.2f}" for cost in _TOPPING_COSTS)
+    _BASE_PRICE_STRS = {name: f"${price:.2f}" for name, price in _VALID_FLAVORS.items()}
+    _VALID_FLAVOR_NAMES_VIEW = tuple(_VALID_FLAVORS)
+    _VALID_TOPPINGS_VIEW = MappingProxyType(_VALID_TOPPINGS)
+
+    def _raise_invalid_flavor(self, flavor: str) -> None:
+        raise ValueError(f"Invalid Ice Storm flavor: {flavor}. Valid options: {self._VALID_FLAVOR_NAMES}")
+
+    def _raise_invalid_topping(self, topping: str) -> None:
+        raise ValueError(f"Invalid topping: {topping}. Valid options: {self._VALID_TOPPING_NAMES}")
+
+    def _raise_invalid_toppings(self, toppings: List[str]) -> None:
+        raise ValueError(f"Invalid toppings: {toppings}. Valid options: {self._VALID_TOPPING_NAMES}")
+
+    def __init__(self, flavor: str) -> None:
+        flavor = sys.intern(flavor)
+        if flavor not in self._VALID_FLAVORS_KEYS:
+            self._raise_invalid_flavor(flavor)
+        self._flavor: str = flavor
+        self._base_price: float = self._VALID_FLAVORS[flavor]
+        # Flavor and base price are immutable, so the receipt header is too.
+        self._header_line: str = f"Ice Storm - {flavor}\n- Base Price: {self._BASE_PRICE_STRS[flavor]}"
+        self._toppings_mask: int = 0
+        self._toppings_total: float = 0.0
+        self._cost_overrides: Optional[Dict[str, float]] = None
+        self._sorted_toppings_cache: List[tuple] = []
+        self._sorted_toppings_dirty: bool = False
+        self._parents: Optional[List[Order]] = None
+
+    def _notify_parents(self) -> None:
+        if self._parents:
+            for parent in self._parents:
+                parent._bump_epoch()
+
+    @classmethod
+    def get_flavors(cls) -> Tuple[str, ...]:
+        """Return the valid Ice Storm flavors."""
+        return cls._VALID_FLAVOR_NAMES_VIEW
+
+    def get_flavor(self) -> str:
+        """Return the current flavor of the Ice Storm."""
+        return self._flavor
+
+    def get_base(self) -> str:
+        """Alias for get_flavor."""
+        return self.get_flavor()
+
+    def get_toppings(self) -> List[str]:
+        """Return a sorted list of added toppings."""
+        return [topping for topping, _ in self._sorted_toppings()]
+
+    def get_num_toppings(self) -> int:
+        """Return the number of added toppings."""
+        return self._toppings_mask.bit_count()
+
+    def add_topping(self, topping: str, cost: Optional[float] = None) -> None:
+        """Add a topping to the Ice Storm, optionally overriding its menu cost."""
+        topping = sys.intern(topping)
+        if topping not in self._VALID_TOPPINGS_KEYS:
+            self._raise_invalid_topping(topping)
+        index = self._TOPPING_INDEX[topping]
+        bit = 1 << index
+        if self._toppings_mask & bit:
+            raise ValueError(f"Topping '{topping}' has already been added.")
+        if cost is None:
+            cost = self._TOPPING_COSTS[index]
+        else:
+            # Overridden costs are rare; keep them in a lazily created side table.
+            if self._cost_overrides is None:
+                self._cost_overrides = {}
+            self._cost_overrides[topping] = cost
+        self._toppings_mask |= bit
+        self._toppings_total += cost
+        self._sorted_toppings_dirty = True
+        self._notify_parents()
+
+    def add_toppings(self, toppings: List[str]) -> None:
+        """Add several menu-priced toppings at once, validating the batch up front."""
+        names = [sys.intern(t) for t in toppings]
+        unknown = [t for t in names if t not in self._VALID_TOPPINGS_KEYS]
+        if unknown:
+            self._raise_invalid_toppings(unknown)
+        mask = self._toppings_mask
+        total = self._toppings_total
+        topping_index = self._TOPPING_INDEX
+        topping_costs = self._TOPPING_COSTS
+        for name in names:
+            index = topping_index[name]
+            bit = 1 << index
+            if mask & bit:
+                raise ValueError(f"Topping '{name}' has already been added.")
+            mask |= bit
+            total += topping_costs[index]
+        self._toppings_mask = mask
+        self._toppings_total = total
+        self._sorted_toppings_dirty = True
+        self._notify_parents()
+
+    def _sorted_toppings(self) -> List[tuple]:
+        """Return the toppings sorted by name, rebuilding the cache only after a change."""
+        if self._sorted_toppings_dirty:
+            mask = self._toppings_mask
+            overrides = self._cost_overrides
+            items = []
+            while mask:
+                bit = mask & -mask
+                index = bit.bit_length() - 1
+                name = self._TOPPING_NAMES[index]
+                if overrides is not None and name in overrides:
+                    cost_str = f"${overrides[name]:.2f}"
+                else:
+                    cost_str = self._TOPPING_COST_STRS[index]
+                items.append((name, cost_str))
+                mask ^= bit
+            self._sorted_toppings_cache = items
+            self._sorted_toppings_dirty = False
+        return self._sorted_toppings_cache
+
+    def get_total(self) -> float:
+        """Calculate and return the total cost of the Ice Storm."""
+        return self._base_price + self._toppings_total
+
+    def get_num_flavors(self) -> int:
+        """Return the number of flavors in the Ice Storm (always 1)."""
+        return 1
+
+    def line_price(self) -> float:
+        """Return the price this Ice Storm contributes to an order."""
+        return self.get_total()
+
+    def receipt_line(self, idx: int) -> str:
+        """Return this Ice Storm's lines on an order receipt."""
+        return f"{idx}. {self}"
+
+    def _batch_row(self) -> tuple:
+        """Return (kind, toppings mask, base price) for batch total kernels.
+
+        Cost overrides are folded into the base price so the kernel can price
+        toppings straight from the class table.
+        """
+        base = self._base_price
+        if self._cost_overrides is not None:
+            for name, cost in self._cost_overrides.items():
+                base += cost - self._TOPPING_COSTS[self._TOPPING_INDEX[name]]
+        return 2, self._toppings_mask, base
+
+    def __str__(self) -> str:
+        """Return a string representation of the Ice Storm."""
+        topping_lines = [f"- {topping}: {cost_str}" for topping, cost_str in self._sorted_toppings()]
+        return "\n".join([
+            self._header_line,
+            *topping_lines,
+            f"Total: ${self.get_total():.2f}",
+        ])
+
@@ -0,0 +1,46 @@
+import unittest
+
+try:
+    import numpy  # noqa: F401
+    HAVE_NUMPY = True
+except ImportError:
+    HAVE_NUMPY = False
+
+from cinos_ice_storm import Drink, Food, IceStorm, Order
+
+
+@unittest.skipUnless(HAVE_NUMPY, "requires numpy")
+class TestBatchTotals(unittest.TestCase):
+    def test_matches_order_get_total(self):
+        from batch_totals import compute_order_totals
+
+        mixed = Order()
+        drink = Drink()
+        drink.add_base('water')
+        mixed.add_item(drink)
+        food = Food('Hotdog')
+        food.add_toppings(['Chili', 'Bacon Bits'])
+        mixed.add_item(food)
+        storm = IceStorm('Banana')
+        storm.add_topping('Cherry', 0.5)  # cost override
+        mixed.add_item(storm)
+
+        empty = Order()
+
+        single = Order()
+        single.add_item(Food('Corndog'))
+
+        orders = [mixed, empty, single]
+        totals = compute_order_totals(orders)
+        self.assertEqual(len(totals), len(orders))
+        for total, order in zip(totals, orders):
+            self.assertAlmostEqual(total, order.get_total())
+
+    def test_empty_batch(self):
+        from batch_totals import compute_order_totals
+
+        self.assertEqual(len(compute_order_totals([])), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
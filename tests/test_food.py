@@ -0,0 +1,36 @@
+import unittest
+from api.food import Food
+
+class TestFood(unittest.TestCase):
+    def setUp(self):
+        self.food = Food('Hotdog')
+
+    def test_add_topping(self):
+        self.food.add_topping('Ketchup')
+        self.assertAlmostEqual(self.food.get_price(), 2.3)
+
+    def test_invalid_topping(self):
+        with self.assertRaises(ValueError):
+            self.food.add_topping('Invalid')
+
+    def test_add_toppings_batch(self):
+        self.food.add_toppings(['Chili', 'Bacon Bits'])
+        self.assertEqual(self.food.get_toppings(), ['Bacon Bits', 'Chili'])
+        self.assertAlmostEqual(self.food.get_price(), 2.3 + 0.6 + 0.3)
+
+    def test_add_toppings_lists_all_unknown_names(self):
+        with self.assertRaises(ValueError) as ctx:
+            self.food.add_toppings(['Chili', 'Bogus', 'Nope'])
+        self.assertIn('Bogus', str(ctx.exception))
+        self.assertIn('Nope', str(ctx.exception))
+        self.assertEqual(self.food.get_toppings(), [])
+
+    def test_add_toppings_duplicate_leaves_state_unchanged(self):
+        self.food.add_topping('Chili')
+        with self.assertRaises(ValueError):
+            self.food.add_toppings(['Ketchup', 'Chili'])
+        self.assertEqual(self.food.get_toppings(), ['Chili'])
+        self.assertAlmostEqual(self.food.get_price(), 2.9)
+
+if __name__ == '__main__':
+    unittest.main()
\ No newline at end of file
@@ -0,0 +1,36 @@
+import unittest
+from api.ice_storm import IceStorm
+
+class TestIceStorm(unittest.TestCase):
+    def setUp(self):
+        self.ice_storm = IceStorm('Mint Chocolate Chip')
+
+    def test_add_topping(self):
+        self.ice_storm.add_topping('Cherry', 0.5)
+        self.assertAlmostEqual(self.ice_storm.get_total(), 4.5)
+
+    def test_invalid_flavor(self):
+        with self.assertRaises(ValueError):
+            IceStorm('Invalid')
+
+    def test_add_toppings_batch(self):
+        self.ice_storm.add_toppings(['Pecans', 'Storios'])
+        self.assertEqual(self.ice_storm.get_toppings(), ['Pecans', 'Storios'])
+        self.assertAlmostEqual(self.ice_storm.get_total(), 4.0 + 0.5 + 1.0)
+
+    def test_add_toppings_lists_all_unknown_names(self):
+        with self.assertRaises(ValueError) as ctx:
+            self.ice_storm.add_toppings(['Pecans', 'Bogus', 'Nope'])
+        self.assertIn('Bogus', str(ctx.exception))
+        self.assertIn('Nope', str(ctx.exception))
+        self.assertEqual(self.ice_storm.get_toppings(), [])
+
+    def test_add_toppings_duplicate_leaves_state_unchanged(self):
+        self.ice_storm.add_topping('Pecans')
+        with self.assertRaises(ValueError):
+            self.ice_storm.add_toppings(['Storios', 'Pecans'])
+        self.assertEqual(self.ice_storm.get_toppings(), ['Pecans'])
+        self.assertAlmostEqual(self.ice_storm.get_total(), 4.5)
+
+if __name__ == '__main__':
+    unittest.main()
\ No newline at end of file